@@ -19,7 +19,7 @@ from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
 from pipecat.frames.frames import Frame, TranscriptionFrame
 from loguru import logger
 
-from src.services.stt import GroqSTT
+from src.services.stt import get_groq_stt
 from src.utils.config import get_settings, get_dev_config
 from src.processors.claim_extractor import ClaimExtractor
 from src.processors.web_fact_checker import WebFactChecker
@@ -160,7 +160,7 @@ async def main():
         )
 
         # Set up STT
-        stt = GroqSTT(
+        stt = get_groq_stt(
             api_key=settings.GROQ_API_KEY,
             model="whisper-large-v3-turbo"
         )
@@ -198,4 +198,11 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Prefer uvloop's libuv-based event loop when it is installed
+    try:
+        import uvloop
+        run = uvloop.run
+    except (ImportError, AttributeError):  # uvloop.run needs uvloop>=0.18
+        run = asyncio.run
+
+    run(main())
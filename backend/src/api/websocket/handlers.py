@@ -1,7 +1,7 @@
 """WebSocket request handlers."""
 
 import json
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Callable, Awaitable
 from fastapi import WebSocket, WebSocketDisconnect
 from loguru import logger
 
@@ -29,6 +29,13 @@ class WebSocketHandler:
         self.orchestrator = orchestrator
         self.message_factory = MessageFactory()
 
+        # Message type -> handler, all taking (websocket, data)
+        self._message_handlers: Dict[str, Callable[[WebSocket, Dict[str, Any]], Awaitable[None]]] = {
+            "connection": self._handle_client_hello,
+            "test_transcript": self._handle_test_transcript,
+            "ping": self._handle_ping,
+        }
+
     async def handle_connection(self, websocket: WebSocket) -> None:
         """
         Handle a WebSocket connection.
@@ -96,18 +103,13 @@ class WebSocketHandler:
             data: The received message data
         """
         message_type = data.get("type")
+        handler = self._message_handlers.get(message_type)
 
-        if message_type == "connection":
-            await self._handle_client_hello(websocket, data)
-
-        elif message_type == "test_transcript":
-            await self._handle_test_transcript(data)
-
-        elif message_type == "ping":
-            await self._handle_ping(websocket)
-
-        else:
+        if handler is None:
             logger.warning(f"Unknown message type: {message_type}")
+            return
+
+        await handler(websocket, data)
 
     async def _handle_client_hello(self, websocket: WebSocket, data: Dict[str, Any]) -> None:
         """
@@ -129,11 +131,12 @@ class WebSocketHandler:
         metadata = self.connection_manager.get_connection_metadata(websocket)
         metadata.update(client_info)
 
-    async def _handle_test_transcript(self, data: Dict[str, Any]) -> None:
+    async def _handle_test_transcript(self, websocket: WebSocket, data: Dict[str, Any]) -> None:
         """
         Handle test transcript submission.
 
         Args:
+            websocket: The client's WebSocket connection
             data: The test transcript data
         """
         if not self.orchestrator:
@@ -152,12 +155,13 @@ class WebSocketHandler:
             logger.info(f"Processing test transcript: {text[:50]}...")
             await self.orchestrator.process_transcription(text, speaker)
 
-    async def _handle_ping(self, websocket: WebSocket) -> None:
+    async def _handle_ping(self, websocket: WebSocket, data: Dict[str, Any]) -> None:
         """
         Handle ping message.
 
         Args:
             websocket: The client's WebSocket connection
+            data: The ping message data
         """
         pong_message = {"type": "pong", "timestamp": MessageFactory.create_timestamp()}
         await self.connection_manager.send_personal_message(websocket, pong_message)
\ No newline at end of file
@@ -17,8 +17,9 @@ from src.core.nlp.claim_extraction_service import ClaimExtractionService
 from src.core.fact_checking.verification_service import VerificationService
 from src.processors.claim_extractor import ClaimExtractor
 from src.processors.web_fact_checker import WebFactChecker
-from src.services.stt import GroqSTT
+from src.services.stt import get_groq_stt
 from src.infrastructure.config import get_settings
+from src.infrastructure.clients.http_client import close_http_clients
 
 
 class WebSocketServer:
@@ -37,7 +38,7 @@ class WebSocketServer:
         logger.info("Initializing services...")
 
         # Initialize STT service
-        stt_service = GroqSTT(
+        stt_service = get_groq_stt(
             api_key=self.settings.GROQ_API_KEY,
             model="whisper-large-v3-turbo"
         )
@@ -91,6 +92,10 @@ class WebSocketServer:
 
         # Start transcription service
         if self.transcription_service:
+            # Prime DNS, TLS and the shared HTTP/2 connection before the first transcription
+            if not await self.transcription_service.stt_service.is_available():
+                logger.warning("Groq STT warmup request failed; first transcription will open a new connection")
+
             await self.transcription_service.start()
 
         logger.info("WebSocket server started successfully")
@@ -103,6 +108,8 @@ class WebSocketServer:
         if self.transcription_service:
             await self.transcription_service.stop()
 
+        await close_http_clients()
+
         logger.info("WebSocket server shut down successfully")
 
     def create_app(self) -> FastAPI:
@@ -1,5 +1,6 @@
 """Fact-checking pipeline orchestrator."""
 
+import asyncio
 from typing import Optional
 from loguru import logger
 
@@ -165,13 +166,20 @@ class FactCheckingOrchestrator:
 
             logger.info(f"Found {len(claims)} claim(s) in sentence")
 
-            # Verify each claim
+            # Drop repeated claims so each is searched and verified once
+            unique_claims = {}
             for claim in claims:
-                await self._verify_and_broadcast_claim(
+                unique_claims.setdefault(claim.text, claim)
+
+            # Verify claims concurrently so the fact checker can batch them
+            await asyncio.gather(*(
+                self._verify_and_broadcast_claim(
                     claim=claim,
                     original_sentence=sentence,
                     speaker=speaker
                 )
+                for claim in unique_claims.values()
+            ))
 
         except ClaimExtractionError:
             # Already handled above
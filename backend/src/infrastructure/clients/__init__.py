@@ -3,5 +3,6 @@
 from src.infrastructure.clients.groq_client import GroqClient
 from src.infrastructure.clients.exa_client import ExaClient
 from src.infrastructure.clients.daily_client import DailyClient
+from src.infrastructure.clients.http_client import get_http_client, close_http_clients
 
-__all__ = ["GroqClient", "ExaClient", "DailyClient"]
\ No newline at end of file
+__all__ = ["GroqClient", "ExaClient", "DailyClient", "get_http_client", "close_http_clients"]
\ No newline at end of file
@@ -1,5 +1,6 @@
 """Groq API client wrapper."""
 
+import asyncio
 from typing import Optional, Dict, Any
 from groq import Groq
 from loguru import logger
@@ -41,7 +42,9 @@ class GroqClient:
             GroqAPIError: If transcription fails
         """
         try:
-            response = self.client.audio.transcriptions.create(
+            # The Groq SDK client is synchronous; run it off the event loop
+            response = await asyncio.to_thread(
+                self.client.audio.transcriptions.create,
                 model=model,
                 file=("audio.wav", audio_data),
                 language=language
@@ -78,7 +81,8 @@ class GroqClient:
             GroqAPIError: If completion fails
         """
         try:
-            response = self.client.chat.completions.create(
+            response = await asyncio.to_thread(
+                self.client.chat.completions.create,
                 model=model,
                 messages=[{"role": "user", "content": prompt}],
                 temperature=temperature,
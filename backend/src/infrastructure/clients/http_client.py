@@ -0,0 +1,50 @@
+"""Shared HTTP clients keyed by base URL."""
+
+from typing import Dict
+
+import httpx
+
+
+_clients: Dict[str, httpx.AsyncClient] = {}
+
+# HTTP/2 multiplexes requests, so a few long-lived connections go a long way
+_LIMITS = httpx.Limits(
+    max_connections=32,
+    max_keepalive_connections=16,
+    keepalive_expiry=60
+)
+
+
+def get_http_client(base_url: str) -> httpx.AsyncClient:
+    """
+    Get the shared HTTP/2 client for a base URL, creating it on first use.
+
+    Every caller talking to the same base URL shares one connection pool,
+    so concurrent requests are multiplexed over a single HTTP/2 connection.
+
+    Args:
+        base_url: Base URL of the API
+
+    Returns:
+        Shared AsyncClient for the base URL
+    """
+    client = _clients.get(base_url)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            base_url=base_url,
+            http2=True,
+            limits=_LIMITS,
+            headers={"Accept-Encoding": "gzip"},
+            timeout=30.0
+        )
+        _clients[base_url] = client
+    return client
+
+
+async def close_http_clients() -> None:
+    """Close all shared HTTP clients."""
+    clients = list(_clients.values())
+    _clients.clear()
+
+    for client in clients:
+        await client.aclose()
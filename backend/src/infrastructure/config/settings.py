@@ -12,6 +12,9 @@ from typing import Any, Dict, Literal
 from pydantic import BaseModel
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Prefer libyaml's C loader; fall back to the pure-Python one if unavailable
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
@@ -98,6 +101,18 @@ class DevConfig(BaseModel):
     logging: LoggingConfig = LoggingConfig()
 
 
+def _load_yaml(path: Path) -> Any:
+    """Parse a YAML file using the fastest available safe loader.
+
+    Args:
+        path: Path to the YAML file
+
+    Returns:
+        Parsed YAML data
+    """
+    return yaml.load(path.read_bytes(), Loader=_YamlLoader)
+
+
 def load_dev_config() -> DevConfig:
     """Load development configuration from YAML file.
 
@@ -113,10 +128,9 @@ def load_dev_config() -> DevConfig:
     if not config_path.exists():
         raise FileNotFoundError(f"dev_config.yaml not found at {config_path}")
 
-    with open(config_path, "r") as f:
-        data = yaml.safe_load(f)
+    data = _load_yaml(config_path)
 
-    return DevConfig(**data)
+    return DevConfig.model_validate(data)
 
 
 @lru_cache
@@ -160,10 +174,9 @@ def load_prompts() -> PromptsConfig:
     if not config_path.exists():
         raise FileNotFoundError(f"prompts.yaml not found at {config_path}")
 
-    with open(config_path, "r") as f:
-        data = yaml.safe_load(f)
+    data = _load_yaml(config_path)
 
-    return PromptsConfig(**data)
+    return PromptsConfig.model_validate(data)
 
 
 @lru_cache
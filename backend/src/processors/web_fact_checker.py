@@ -1,10 +1,12 @@
 """WebFactChecker using PydanticAI for structured Groq output."""
 
-import json
+import asyncio
 import os
 import time
-from typing import Any, Dict, List, Literal, Optional
+from typing import Any, List, Literal, Optional, Set, Tuple
 
+import orjson
+from cachetools import LRUCache
 from loguru import logger
 from pydantic import BaseModel, Field, ValidationError
 from pydantic_ai import Agent
@@ -36,11 +38,30 @@ class VerificationResult(BaseModel):
     )
 
 
+class BatchVerificationItem(VerificationResult):
+    """Verification result for one claim within a batch."""
+
+    claim_number: int = Field(
+        description="Number of the claim this result is for, as given in the prompt"
+    )
+
+
+class BatchVerificationResult(BaseModel):
+    """Structured result for several claims verified in one LLM call."""
+
+    results: List[BatchVerificationItem] = Field(
+        default_factory=list,
+        description="One verification result per claim, each tagged with its claim number"
+    )
+
+
 class WebFactChecker:
     """Verify claims using Exa web search and Groq with PydanticAI.
 
     This version uses PydanticAI for consistent structured output
-    from Groq across the entire pipeline.
+    from Groq across the entire pipeline. Claims whose evidence arrives
+    within a short window of each other are verified together in a single
+    Groq request.
     """
 
     def __init__(
@@ -48,6 +69,9 @@ class WebFactChecker:
         groq_api_key: str,
         exa_api_key: str,
         allowed_domains: Optional[List[str]] = None,
+        batch_window: float = 0.05,
+        max_batch_size: int = 8,
+        cache_size: int = 1024,
     ):
         """Initialize the fact checker with PydanticAI.
 
@@ -55,6 +79,9 @@ class WebFactChecker:
             groq_api_key: Groq API key
             exa_api_key: Exa API key for web search
             allowed_domains: Allowed domains for search (optional)
+            batch_window: Seconds to wait for more claims before sending a batch
+            max_batch_size: Maximum number of claims verified in one Groq request
+            cache_size: Maximum number of verdicts kept in the in-memory cache
         """
         self._config = get_dev_config()
         self._prompts = get_prompts()
@@ -73,9 +100,23 @@ class WebFactChecker:
             output_type=VerificationResult,
             instructions=self._prompts.fact_verification["system_prompt"],
         )
+        self.batch_verification_agent = Agent(
+            model=model_string,
+            output_type=BatchVerificationResult,
+            instructions=self._prompts.fact_verification["system_prompt"],
+        )
+
+        # Pending (claim_text, results, future) entries waiting to be batched
+        self._batch_window = batch_window
+        self._max_batch_size = max_batch_size
+        self._pending: List[Tuple[str, List, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._batch_tasks: Set[asyncio.Task] = set()
+        # Verifications past the cache check that have not finished yet
+        self._in_flight = 0
 
-        # In-memory cache for results
-        self._cache: Dict[str, FactCheckVerdict] = {}
+        # Bounded in-memory cache for results (least recently used evicted first)
+        self._cache: LRUCache = LRUCache(maxsize=cache_size)
 
         logger.info(
             f"WebFactChecker initialized with PydanticAI and model: {self._config.llm.verification_model}"
@@ -99,6 +140,7 @@ class WebFactChecker:
             logger.info(f"Cache hit: {claim_text}")
             return self._cache[cache_key]
 
+        self._in_flight += 1
         try:
             # Measure search latency
             start_time = time.time()
@@ -120,9 +162,9 @@ class WebFactChecker:
                     evidence_url=None,
                 )
             else:
-                # Verify with Groq using PydanticAI
+                # Verify with Groq using PydanticAI (batched with concurrent claims)
                 verify_start = time.time()
-                verdict = await self._verify_with_groq(claim_text, results)
+                verdict = await self._enqueue_verification(claim_text, results)
                 verify_latency = (time.time() - verify_start) * 1000
                 logger.info(f"Groq verification completed in {verify_latency:.0f}ms")
 
@@ -169,20 +211,96 @@ class WebFactChecker:
                 rationale=f"Fact-checking failed: {str(e)}",
                 evidence_url=None,
             )
+        finally:
+            self._in_flight -= 1
+            # Claims still waiting may have been held back only for this one
+            if self._pending and len(self._pending) >= self._in_flight:
+                self._flush()
 
-    async def _verify_with_groq(
+    async def _enqueue_verification(
         self, claim_text: str, results: List
     ) -> FactCheckVerdict:
-        """Verify claim using Groq LLM with PydanticAI.
+        """Queue a claim for batched Groq verification and wait for its verdict.
 
         Args:
             claim_text: The claim to verify
             results: Search results from Exa
 
         Returns:
-            FactCheckVerdict with structured output from Groq
+            FactCheckVerdict for the claim
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((claim_text, results, future))
+
+        # Once every in-flight verification is queued there is nothing left to
+        # wait for (e.g. a lone claim), so send immediately instead of on the timer
+        if len(self._pending) >= min(self._max_batch_size, self._in_flight):
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self._batch_window, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        """Send all pending claims to Groq as one batch."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        task = asyncio.create_task(self._run_batch(batch))
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+
+    async def _run_batch(self, batch: List[Tuple[str, List, asyncio.Future]]) -> None:
+        """Verify a batch of claims and resolve each waiting future.
+
+        Args:
+            batch: Pending (claim_text, results, future) entries
+        """
+        if len(batch) == 1:
+            claim_text, results, _ = batch[0]
+            verdicts = await asyncio.gather(
+                self._verify_with_groq(claim_text, results),
+                return_exceptions=True
+            )
+        else:
+            try:
+                verdicts = await self._verify_batch_with_groq(
+                    [(claim_text, results) for claim_text, results, _ in batch]
+                )
+            except Exception as e:
+                logger.warning(
+                    f"Batched verification of {len(batch)} claims failed ({e!r}), "
+                    f"falling back to per-claim requests"
+                )
+                verdicts = await asyncio.gather(
+                    *(self._verify_with_groq(claim_text, results) for claim_text, results, _ in batch),
+                    return_exceptions=True
+                )
+
+        for (_, _, future), verdict in zip(batch, verdicts):
+            if future.done():
+                # Caller gave up waiting (e.g. cancelled)
+                continue
+            if isinstance(verdict, BaseException):
+                future.set_exception(verdict)
+            else:
+                future.set_result(verdict)
+
+    def _format_passages(self, results: List) -> str:
+        """Format Exa search results as JSON evidence passages.
+
+        Args:
+            results: Search results from Exa
+
+        Returns:
+            JSON string of passages with title, url and text
         """
-        # Format evidence passages
         # Handle different possible attribute names from Exa
         passages = []
         for r in results:
@@ -213,23 +331,26 @@ class WebFactChecker:
         if not passages:
             raise ValueError("No valid passages extracted from search results")
 
-        passages = json.dumps(passages, indent=2)
+        return orjson.dumps(passages, option=orjson.OPT_INDENT_2).decode()
 
-        # Create the user prompt with claim and evidence
-        user_prompt = self._prompts.fact_verification["user_prompt_template"].format(
-            claim_text=claim_text,
-            passages=passages
-        )
+    async def _run_agent(self, agent: Agent, user_prompt: str) -> Any:
+        """Run a PydanticAI agent and return its structured output.
 
-        # Use PydanticAI agent to get structured verification
+        Args:
+            agent: The agent to run
+            user_prompt: Prompt to send
+
+        Returns:
+            The agent's structured output
+        """
         try:
-            result = await self.verification_agent.run(user_prompt)
+            result = await agent.run(user_prompt)
 
             # Get the structured output - handle different result formats
             if hasattr(result, 'output'):
-                verification = result.output
+                return result.output
             elif hasattr(result, 'data'):
-                verification = result.data
+                return result.data
             else:
                 # Log what we actually got
                 logger.error(f"Unexpected result format from PydanticAI: {type(result)}")
@@ -249,6 +370,89 @@ class WebFactChecker:
             logger.error(f"Full traceback:", exc_info=True)
             raise
 
+    async def _verify_with_groq(
+        self, claim_text: str, results: List
+    ) -> FactCheckVerdict:
+        """Verify claim using Groq LLM with PydanticAI.
+
+        Args:
+            claim_text: The claim to verify
+            results: Search results from Exa
+
+        Returns:
+            FactCheckVerdict with structured output from Groq
+        """
+        passages = self._format_passages(results)
+
+        # Create the user prompt with claim and evidence
+        user_prompt = self._prompts.fact_verification["user_prompt_template"].format(
+            claim_text=claim_text,
+            passages=passages
+        )
+
+        # Use PydanticAI agent to get structured verification
+        verification = await self._run_agent(self.verification_agent, user_prompt)
+
+        return self._to_verdict(claim_text, verification)
+
+    async def _verify_batch_with_groq(
+        self, items: List[Tuple[str, List]]
+    ) -> List[FactCheckVerdict]:
+        """Verify several claims in a single Groq request.
+
+        Args:
+            items: (claim_text, results) pairs to verify
+
+        Returns:
+            One FactCheckVerdict per item, in the same order
+
+        Raises:
+            ValueError: If the results do not map one-to-one onto the claim numbers
+        """
+        claims = "\n".join(
+            f"Claim {i}: {claim_text}\nEvidence for claim {i}:\n{self._format_passages(results)}\n"
+            for i, (claim_text, results) in enumerate(items, 1)
+        )
+
+        user_prompt = self._prompts.fact_verification["batch_user_prompt_template"].format(
+            claim_count=len(items),
+            claims=claims
+        )
+
+        batch_result = await self._run_agent(self.batch_verification_agent, user_prompt)
+
+        verifications = getattr(batch_result, 'results', None) or []
+
+        # Match results by claim number, never by position, so a reordered or
+        # partial response cannot attach one claim's verdict to another
+        by_number: dict[int, BatchVerificationItem] = {}
+        for verification in verifications:
+            number = verification.claim_number
+            if not 1 <= number <= len(items) or number in by_number:
+                raise ValueError(f"Invalid or duplicate claim number {number} in batch results")
+            by_number[number] = verification
+
+        if len(by_number) != len(items):
+            missing = sorted(set(range(1, len(items) + 1)) - by_number.keys())
+            raise ValueError(f"Batch results missing claim numbers {missing}")
+
+        logger.info(f"Verified {len(items)} claims in one Groq request")
+
+        return [
+            self._to_verdict(claim_text, by_number[i])
+            for i, (claim_text, _) in enumerate(items, 1)
+        ]
+
+    def _to_verdict(self, claim_text: str, verification: VerificationResult) -> FactCheckVerdict:
+        """Convert a loosely-typed verification result to a FactCheckVerdict.
+
+        Args:
+            claim_text: The claim that was verified
+            verification: Structured output from Groq
+
+        Returns:
+            FactCheckVerdict with normalised fields
+        """
         # Convert to FactCheckVerdict - handle Any types safely
         # Normalize status to valid values
         status_str = str(verification.status).lower() if verification.status else "unclear"
@@ -5,7 +5,7 @@ Supported providers:
 - Avalon (AquaVoice) - Developer-optimized, 97.3% accuracy on technical terms
 """
 
-from .groq_stt import GroqSTT
+from .groq_stt import GroqSTT, get_groq_stt
 from .avalon_stt import AvalonSTT
 
-__all__ = ["GroqSTT", "AvalonSTT"]
+__all__ = ["GroqSTT", "AvalonSTT", "get_groq_stt"]
@@ -3,11 +3,15 @@
 Wrapper for Groq's Whisper API for speech-to-text transcription.
 """
 
-import io
-import httpx
+import math
+from functools import lru_cache
 from typing import Optional
 from loguru import logger
 
+from src.domain.exceptions import STTServiceError, RateLimitError
+from src.infrastructure.clients.http_client import get_http_client
+from src.utils.rate_limiter import RateLimiter
+
 
 class GroqSTT:
     """Groq Speech-to-Text service using Whisper models."""
@@ -23,6 +27,9 @@ class GroqSTT:
         self.api_key = api_key
         self.model = model
         self.base_url = "https://api.groq.com/openai/v1"
+        self._auth_headers = {"Authorization": f"Bearer {api_key}"}
+        # Transcription is latency-sensitive: give up after ~16s of backoff
+        self.rate_limiter = RateLimiter("Groq STT", backoff_cap=8.0, max_retries=2)
 
     async def transcribe(
         self,
@@ -40,40 +47,57 @@ class GroqSTT:
             Transcribed text string
 
         Raises:
+            STTServiceError: If the API responds with a non-2xx status
+            RateLimitError: If still rate limited after all retries
             Exception: If transcription fails
         """
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                # Prepare multipart form data
-                files = {
-                    "file": ("audio.wav", io.BytesIO(audio_data), "audio/wav")
-                }
-                data = {
-                    "model": self.model,
-                    "response_format": "text"
-                }
-                if language:
-                    data["language"] = language
-
-                headers = {
-                    "Authorization": f"Bearer {self.api_key}"
-                }
+            client = get_http_client(self.base_url)
+
+            # Prepare multipart form data
+            files = {
+                "file": ("audio.wav", audio_data, "audio/wav")
+            }
+            data = {
+                "model": self.model,
+                "response_format": "text"
+            }
+            if language:
+                data["language"] = language
+
+            for attempt in range(self.rate_limiter.max_retries + 1):
+                await self.rate_limiter.acquire()
 
                 # Make API request
                 response = await client.post(
-                    f"{self.base_url}/audio/transcriptions",
-                    headers=headers,
+                    "/audio/transcriptions",
+                    headers=self._auth_headers,
                     files=files,
                     data=data
                 )
+                self.rate_limiter.update(response.headers)
+
+                if response.status_code != 429:
+                    break
+
+                delay = self.rate_limiter.backoff(attempt, response.headers.get("retry-after"))
+                if attempt == self.rate_limiter.max_retries:
+                    raise RateLimitError("Groq STT", math.ceil(delay))
 
-                response.raise_for_status()
-                transcription = response.text.strip()
+                logger.warning(f"Groq STT rate limited, retrying in {delay:.2f}s (attempt {attempt + 1})")
+
+            body = (await response.aread()).decode("utf-8", "replace")
+
+            if not response.is_success:
+                logger.error(f"HTTP error during transcription: {response.status_code} - {body}")
+                raise STTServiceError(
+                    "Groq transcription request failed",
+                    {"status_code": response.status_code, "body": body[:500]}
+                )
 
-                return transcription
+            return body.strip()
 
-        except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP error during transcription: {e.response.status_code} - {e.response.text}")
+        except (STTServiceError, RateLimitError):
             raise
         except Exception as e:
             logger.error(f"Error during transcription: {e}")
@@ -87,14 +111,31 @@ class GroqSTT:
             True if service is reachable
         """
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get(
-                    f"{self.base_url}/models",
-                    headers={"Authorization": f"Bearer {self.api_key}"}
-                )
-                return response.status_code == 200
+            response = await get_http_client(self.base_url).get(
+                "/models",
+                headers=self._auth_headers,
+                timeout=5.0
+            )
+            return response.status_code == 200
         except Exception:
             return False
 
 
-__all__ = ["GroqSTT"]
+@lru_cache(maxsize=8)
+def get_groq_stt(api_key: str, model: str = "whisper-large-v3-turbo") -> GroqSTT:
+    """Get a cached GroqSTT instance for an API key and model.
+
+    Sharing the instance keeps its rate-limit state across pipeline
+    restarts instead of creating a new service per run.
+
+    Args:
+        api_key: Groq API key
+        model: Whisper model to use
+
+    Returns:
+        GroqSTT instance
+    """
+    return GroqSTT(api_key=api_key, model=model)
+
+
+__all__ = ["GroqSTT", "get_groq_stt"]
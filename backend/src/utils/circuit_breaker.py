@@ -3,11 +3,30 @@
 import asyncio
 import time
 from enum import Enum
-from typing import Optional, Callable, Any, Dict
+from typing import Optional, Callable, Any, Dict, Tuple, Type, Union
 from functools import wraps
+import httpx
 from loguru import logger
 
-from src.domain.exceptions import ExternalServiceError
+from src.domain.exceptions import (
+    ExternalServiceError,
+    STTServiceError,
+    RateLimitError,
+    TimeoutError as DomainTimeoutError
+)
+
+
+ExceptionTypes = Union[Type[Exception], Tuple[Type[Exception], ...]]
+
+# Failures that indicate the external service is unhealthy
+DEFAULT_EXPECTED_EXCEPTIONS: Tuple[Type[Exception], ...] = (
+    ExternalServiceError,
+    STTServiceError,
+    RateLimitError,
+    DomainTimeoutError,
+    asyncio.TimeoutError,
+    httpx.HTTPError,
+)
 
 
 class CircuitState(Enum):
@@ -29,7 +48,7 @@ class CircuitBreaker:
         name: str,
         failure_threshold: int = 5,
         recovery_timeout: int = 60,
-        expected_exception: type = Exception
+        expected_exception: ExceptionTypes = DEFAULT_EXPECTED_EXCEPTIONS
     ):
         """
         Initialize circuit breaker.
@@ -38,62 +57,127 @@ class CircuitBreaker:
             name: Name of the service
             failure_threshold: Number of failures before opening circuit
             recovery_timeout: Seconds to wait before trying half-open
-            expected_exception: Exception type to catch
+            expected_exception: Exception type (or tuple of types) counted as failures
         """
         self.name = name
         self.failure_threshold = failure_threshold
         self.recovery_timeout = recovery_timeout
         self.expected_exception = expected_exception
 
-        self.state = CircuitState.CLOSED
-        self.failure_count = 0
-        self.last_failure_time: Optional[float] = None
+        # (state, failure_count, last_failure_monotonic, last_failure_wall) is
+        # replaced as a whole so readers never observe a half-updated state
+        self._snapshot: Tuple[CircuitState, int, Optional[float], Optional[float]] = (
+            CircuitState.CLOSED, 0, None, None
+        )
         self.success_count = 0
+        self._status_snapshot: Dict[str, Any] = {}
+        self._refresh_status()
+
+    @property
+    def state(self) -> CircuitState:
+        """Current circuit state."""
+        return self._snapshot[0]
+
+    @property
+    def failure_count(self) -> int:
+        """Number of failures recorded since the circuit last closed."""
+        return self._snapshot[1]
+
+    @property
+    def last_failure_time(self) -> Optional[float]:
+        """Unix timestamp of the last recorded failure."""
+        return self._snapshot[3]
+
+    def _refresh_status(self) -> None:
+        """Rebuild the cached status view after a state change."""
+        state, failure_count, _, last_failure_time = self._snapshot
+        self._status_snapshot = {
+            "name": self.name,
+            "state": state.value,
+            "failure_count": failure_count,
+            "success_count": self.success_count,
+            "last_failure": last_failure_time,
+            "can_retry": True
+        }
 
     def _should_attempt_reset(self) -> bool:
         """Check if enough time has passed to attempt reset."""
-        if self.last_failure_time is None:
+        last_failure_time = self._snapshot[2]
+        if last_failure_time is None:
             return True
 
-        return time.time() - self.last_failure_time >= self.recovery_timeout
+        return time.monotonic() - last_failure_time >= self.recovery_timeout
 
     def _record_success(self) -> None:
         """Record a successful call."""
-        if self.state == CircuitState.HALF_OPEN:
+        state, _, last_failure_monotonic, last_failure_time = self._snapshot
+        if state is CircuitState.HALF_OPEN:
             self.success_count += 1
             if self.success_count >= 2:  # Need 2 successful calls to fully close
-                self.state = CircuitState.CLOSED
-                self.failure_count = 0
+                self._snapshot = (CircuitState.CLOSED, 0, last_failure_monotonic, last_failure_time)
                 self.success_count = 0
                 logger.info(f"Circuit breaker '{self.name}' closed (service recovered)")
+            self._refresh_status()
 
     def _record_failure(self) -> None:
         """Record a failed call."""
-        self.failure_count += 1
-        self.last_failure_time = time.time()
+        state, failure_count, _, _ = self._snapshot
+        failure_count += 1
 
-        if self.state == CircuitState.HALF_OPEN:
+        if state is CircuitState.HALF_OPEN:
             # Failed during recovery attempt, reopen
-            self.state = CircuitState.OPEN
+            state = CircuitState.OPEN
             logger.warning(f"Circuit breaker '{self.name}' reopened (recovery failed)")
-        elif self.failure_count >= self.failure_threshold:
-            self.state = CircuitState.OPEN
+        elif failure_count >= self.failure_threshold:
+            state = CircuitState.OPEN
             logger.warning(
                 f"Circuit breaker '{self.name}' opened "
-                f"(failures: {self.failure_count}/{self.failure_threshold})"
+                f"(failures: {failure_count}/{self.failure_threshold})"
             )
 
+        self._snapshot = (state, failure_count, time.monotonic(), time.time())
+        self._refresh_status()
+
     def _check_state(self) -> None:
         """Check and update circuit state."""
-        if self.state == CircuitState.OPEN and self._should_attempt_reset():
-            self.state = CircuitState.HALF_OPEN
+        state, failure_count, last_failure_monotonic, last_failure_time = self._snapshot
+        if state is CircuitState.OPEN and self._should_attempt_reset():
+            self._snapshot = (
+                CircuitState.HALF_OPEN, failure_count, last_failure_monotonic, last_failure_time
+            )
             self.success_count = 0
+            self._refresh_status()
             logger.info(f"Circuit breaker '{self.name}' half-open (attempting recovery)")
 
     async def call(self, func: Callable, *args, **kwargs) -> Any:
         """
         Execute function with circuit breaker protection.
 
+        Args:
+            func: Async function to call
+            *args: Function arguments
+            **kwargs: Function keyword arguments
+
+        Returns:
+            Function result
+
+        Raises:
+            ExternalServiceError: If circuit is open
+        """
+        # Fast path: a closed circuit only needs to count failures
+        if self._snapshot[0] is CircuitState.CLOSED:
+            try:
+                return await func(*args, **kwargs)
+            except self.expected_exception:
+                self._record_failure()
+                raise
+
+        return await self._call_recovering(func, *args, **kwargs)
+
+    async def _call_recovering(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Execute function while the circuit is OPEN or HALF_OPEN.
+
         Args:
             func: Async function to call
             *args: Function arguments
@@ -106,13 +190,14 @@ class CircuitBreaker:
             ExternalServiceError: If circuit is open
         """
         self._check_state()
+        state, failure_count, _, _ = self._snapshot
 
-        if self.state == CircuitState.OPEN:
+        if state is CircuitState.OPEN:
             raise ExternalServiceError(
                 self.name,
                 f"Service {self.name} is temporarily unavailable (circuit open)",
                 {
-                    "failure_count": self.failure_count,
+                    "failure_count": failure_count,
                     "retry_after": self.recovery_timeout
                 }
             )
@@ -122,27 +207,22 @@ class CircuitBreaker:
             self._record_success()
             return result
 
-        except self.expected_exception as e:
+        except self.expected_exception:
             self._record_failure()
             raise
 
     def get_status(self) -> Dict[str, Any]:
         """Get current circuit breaker status."""
-        return {
-            "name": self.name,
-            "state": self.state.value,
-            "failure_count": self.failure_count,
-            "success_count": self.success_count,
-            "last_failure": self.last_failure_time,
-            "can_retry": self._should_attempt_reset() if self.state == CircuitState.OPEN else True
-        }
+        # Only an open circuit's retry eligibility depends on the clock
+        if self._snapshot[0] is CircuitState.OPEN:
+            return {**self._status_snapshot, "can_retry": self._should_attempt_reset()}
+        return dict(self._status_snapshot)
 
     def reset(self) -> None:
         """Manually reset the circuit breaker."""
-        self.state = CircuitState.CLOSED
-        self.failure_count = 0
+        self._snapshot = (CircuitState.CLOSED, 0, None, None)
         self.success_count = 0
-        self.last_failure_time = None
+        self._refresh_status()
         logger.info(f"Circuit breaker '{self.name}' manually reset")
 
 
@@ -150,7 +230,7 @@ def with_circuit_breaker(
     name: str,
     failure_threshold: int = 5,
     recovery_timeout: int = 60,
-    expected_exception: type = Exception
+    expected_exception: ExceptionTypes = DEFAULT_EXPECTED_EXCEPTIONS
 ):
     """
     Decorator to add circuit breaker to async functions.
@@ -159,7 +239,7 @@ def with_circuit_breaker(
         name: Circuit breaker name
         failure_threshold: Number of failures before opening
         recovery_timeout: Seconds before retry
-        expected_exception: Exception type to catch
+        expected_exception: Exception type (or tuple of types) counted as failures
     """
     circuit = CircuitBreaker(name, failure_threshold, recovery_timeout, expected_exception)
 
@@ -0,0 +1,132 @@
+"""Rate limiting driven by API rate-limit response headers."""
+
+import asyncio
+import random
+import re
+import time
+from email.utils import parsedate_to_datetime
+from typing import Mapping, Optional
+from loguru import logger
+
+
+# Groq reset durations look like "7.66s", "2m59.56s" or "120ms"
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_UNIT_SECONDS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def _parse_reset(value: Optional[str]) -> float:
+    """
+    Parse a rate-limit reset header into seconds.
+
+    Args:
+        value: Header value such as "2m59.56s", "7.66s", "120ms", "3" or an
+            HTTP-date ("Wed, 21 Oct 2015 07:28:00 GMT")
+
+    Returns:
+        Seconds until the limit resets (0.0 if missing or unparseable)
+    """
+    if not value:
+        return 0.0
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    # Retry-After may be an absolute HTTP-date instead of a delay
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        pass
+
+    return sum(
+        float(amount) * _UNIT_SECONDS[unit]
+        for amount, unit in _DURATION_PART.findall(value)
+    )
+
+
+class RateLimiter:
+    """
+    Paces requests to an API using its rate-limit response headers.
+
+    Reads x-ratelimit-remaining-requests / x-ratelimit-reset-requests after
+    each response and holds back further requests until the window resets
+    when few requests remain. On 429 responses it honours Retry-After with
+    exponential backoff and jitter.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        min_remaining: int = 3,
+        backoff_base: float = 1.0,
+        backoff_cap: float = 32.0,
+        max_retries: int = 5
+    ):
+        """
+        Initialize rate limiter.
+
+        Args:
+            name: Name of the rate-limited service
+            min_remaining: Pause once remaining requests drop below this
+            backoff_base: Initial backoff in seconds after a 429
+            backoff_cap: Maximum backoff in seconds
+            max_retries: Number of retries allowed after 429 responses
+        """
+        self.name = name
+        self.min_remaining = min_remaining
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.max_retries = max_retries
+
+        # Monotonic time before which no new request should be sent
+        self._resume_at = 0.0
+
+    async def acquire(self) -> None:
+        """Wait until the service is expected to accept another request."""
+        delay = self._resume_at - time.monotonic()
+        if delay > 0:
+            logger.debug(f"Rate limiter '{self.name}' pacing request by {delay:.2f}s")
+            await asyncio.sleep(delay)
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        """
+        Record rate-limit state from response headers.
+
+        Args:
+            headers: Response headers
+        """
+        remaining = headers.get("x-ratelimit-remaining-requests")
+        if remaining is None:
+            return
+
+        try:
+            remaining_count = int(remaining)
+        except ValueError:
+            return
+
+        if remaining_count < self.min_remaining:
+            # Never pause longer than a backoff would, however long the window is
+            reset = min(self.backoff_cap, _parse_reset(headers.get("x-ratelimit-reset-requests")))
+            self._resume_at = max(self._resume_at, time.monotonic() + reset)
+            logger.warning(
+                f"Rate limiter '{self.name}': {remaining_count} requests remaining, "
+                f"pausing for {reset:.2f}s"
+            )
+
+    def backoff(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """
+        Schedule a backoff after a rate-limited (429) response.
+
+        Args:
+            attempt: Zero-based retry attempt number
+            retry_after: Retry-After header value, if any
+
+        Returns:
+            Seconds until the next request may be sent (at most backoff_cap)
+        """
+        delay = random.uniform(0, min(self.backoff_cap, self.backoff_base * 2 ** attempt))
+        delay = min(self.backoff_cap, max(delay, _parse_reset(retry_after)))
+
+        self._resume_at = max(self._resume_at, time.monotonic() + delay)
+        return delay
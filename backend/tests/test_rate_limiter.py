@@ -0,0 +1,32 @@
+"""Tests for rate-limit header parsing."""
+
+import time
+from email.utils import formatdate
+
+import pytest
+
+from src.utils.rate_limiter import _parse_reset
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("2m59.56s", 179.56),
+        ("7.66s", 7.66),
+        ("120ms", 0.12),
+        ("3", 3.0),
+        (None, 0.0),
+        ("", 0.0),
+    ],
+)
+def test_parse_reset_durations(value, expected):
+    assert _parse_reset(value) == pytest.approx(expected)
+
+
+def test_parse_reset_http_date():
+    value = formatdate(time.time() + 30, usegmt=True)
+    assert _parse_reset(value) == pytest.approx(30, abs=2)
+
+
+def test_parse_reset_http_date_in_past():
+    assert _parse_reset("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0